@@ -22,10 +22,22 @@ import zipfile
 import re
 # Importa el módulo para interactuar con el sistema de archivos (rutas, etc.)
 import os
+# Importa la clase Path para construir rutas de archivos de salida
+from pathlib import Path
+# Importa suppress para ignorar errores al borrar archivos temporales
+from contextlib import suppress
+# Importa los módulos para proyectar el ZIP en memoria y leer sus cabeceras binarias sin copias
+import mmap
+import struct
+# Importa zlib para verificar el CRC de los archivos leídos directamente del ZIP
+import zlib
 # Importa el módulo para manejar argumentos de línea de comandos
 import argparse
-# Importa una clase para leer archivos binarios como texto (útil al leer archivos dentro del ZIP)
-from io import TextIOWrapper
+# Importa el módulo de hilos, las colas y el pool de hilos para procesar los .tex en
+# paralelo y escribir los archivos de salida en segundo plano
+from concurrent.futures import ThreadPoolExecutor
+# Importa clases para leer archivos binarios como texto con un búfer amplio (útil al leer archivos dentro del ZIP)
+from io import BufferedReader, TextIOWrapper
 # Importa la librería rich para logs coloridos y atractivos
 from rich.console import Console
 from rich.panel import Panel
@@ -34,6 +46,135 @@ from rich.progress import track
 
 console = Console()
 
+# Expresiones regulares compiladas una sola vez al cargar el módulo
+_CITE_RE = re.compile(r'\\cite\w*\{([^}]+)\}')  # Busca \cite{...}, \citep{...}, etc.
+_OPEN_CITE_RE = re.compile(r'\\cite\w*\{[^}]*$')  # \cite{... sin cerrar al final del texto
+# Saltos de línea seguidos de una línea que abre una entrada del .bib. Empezar el patrón
+# por el literal '\n' permite al motor saltar directamente entre saltos de línea, en vez
+# de comprobar un ancla ^ en cada posición; la primera línea se comprueba aparte
+_ENTRY_START_RE = re.compile(rb'\n[^\S\n]*@')
+_FIRST_ENTRY_RE = re.compile(rb'[^\S\n]*@')
+_ENTRY_HEAD_RE = re.compile(rb'@\w+\{\s*([^,\s]+)\s*,')  # Cabecera @tipo{clave, (admite espacios)
+_CR_NEWLINE_RE = re.compile(rb'\r\n?')  # Saltos de línea \r\n o \r, a normalizar como '\n'
+
+# Tamaño de los búferes de lectura y escritura (1 MiB): agrupa las descompresiones
+# del ZIP y las escrituras a disco en bloques grandes en lugar de muchas operaciones pequeñas
+_IO_BUFFER_SIZE = 1 << 20
+# Los .tex de hasta este tamaño (16 MiB) se leen de una sola vez; los mayores se
+# recorren por bloques para no cargarlos completos en memoria
+_STREAM_THRESHOLD = 16 << 20
+# Longitud máxima de una cita cuya llave sigue abierta al final de un bloque: más allá
+# se da por hecho que no se cerrará y se descarta
+_MAX_OPEN_CITE = 4096
+# Cabecera local de cada archivo dentro del ZIP (30 bytes): firma, campos fijos que no
+# necesitamos y longitudes del nombre y del campo extra que preceden a los datos
+_LOCAL_HEADER = struct.Struct('<4s22xHH')
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+
+def decode_text(data):
+    """
+    Decodifica como UTF-8 el contenido de un archivo leído del ZIP, normalizando
+    los saltos de línea a '\\n' igual que lo haría TextIOWrapper.
+    
+    Args:
+        data (bytes | memoryview): Contenido binario del archivo.
+    
+    Returns:
+        str: Texto decodificado.
+    
+    Raises:
+        UnicodeDecodeError: Si el contenido no está codificado en UTF-8.
+    """
+    text = str(data, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+def read_member(z, info, mapped=None):
+    """
+    Devuelve el contenido de un archivo del ZIP.
+    Si el archivo está almacenado sin comprimir (ZIP_STORED) y se dispone del ZIP
+    proyectado en memoria, devuelve una vista sobre sus datos sin copiarlos; en
+    otro caso lo lee con ZipFile.read.
+    
+    Args:
+        z (zipfile.ZipFile): Archivo ZIP abierto.
+        info (zipfile.ZipInfo): Entrada del archivo dentro del ZIP.
+        mapped (mmap.mmap, opcional): El mismo ZIP proyectado en memoria.
+    
+    Returns:
+        bytes | memoryview: Contenido del archivo.
+    
+    Raises:
+        zipfile.BadZipFile: Si la cabecera local o el CRC del archivo no son válidos.
+    """
+    # Los archivos comprimidos o cifrados necesitan pasar por zipfile
+    if mapped is None or info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+        return z.read(info)
+    signature, name_length, extra_length = _LOCAL_HEADER.unpack_from(mapped, info.header_offset)
+    if signature != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Cabecera local no válida para {info.filename}")
+    start = info.header_offset + _LOCAL_HEADER.size + name_length + extra_length
+    data = memoryview(mapped)[start:start + info.file_size]
+    # Comprobamos el CRC igual que haría ZipFile.read
+    if zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"CRC incorrecto en el archivo {info.filename}")
+    return data
+
+def iter_text_blocks(f, size=_IO_BUFFER_SIZE):
+    """
+    Lee un archivo de texto en bloques de unos `size` caracteres, completando cada
+    bloque hasta el final de su línea para no partir un comando por la mitad.
+    
+    Args:
+        f (io.TextIOBase): Archivo de texto abierto.
+        size (int): Tamaño aproximado de cada bloque.
+    
+    Yields:
+        str: Bloques consecutivos del archivo.
+    """
+    while True:
+        block = f.read(size)
+        if not block:
+            return
+        yield block + f.readline()
+
+def update_citations(citations, chunks, pattern=_CITE_RE):
+    """
+    Añade al conjunto `citations` las claves citadas en los fragmentos de texto recibidos.
+    Permite procesar los .tex por bloques, sin tener en memoria su contenido completo.
+    Si una cita abre la llave en un fragmento y la cierra en otro, se conserva la parte
+    pendiente hasta encontrar la `}`, salvo que supere _MAX_OPEN_CITE caracteres, en
+    cuyo caso se descarta como cita sin cerrar.
+    
+    Args:
+        citations (set): Conjunto donde se acumulan las claves citadas.
+        chunks (iterable): Fragmentos de texto de los archivos .tex (p. ej. un archivo completo).
+        pattern (re.Pattern): Expresión regular que captura las claves de cada cita.
+    
+    Returns:
+        set: El mismo conjunto `citations`, actualizado.
+    """
+    pending = ''
+    for chunk in chunks:
+        if pending:
+            # Mientras la cita siga abierta solo hace falta buscar la `}` que la cierra,
+            # sin volver a recorrer lo ya acumulado
+            if '}' not in chunk:
+                pending = pending + chunk if len(pending) + len(chunk) <= _MAX_OPEN_CITE else ''
+                continue
+            chunk = pending + chunk
+        # Una cita sin cerrar al final del fragmento solo puede empezar tras la última `}`.
+        # Se deja fuera de la búsqueda y se guarda para completarla con los fragmentos siguientes
+        open_match = _OPEN_CITE_RE.search(chunk, chunk.rfind('}') + 1)
+        end = open_match.start() if open_match else len(chunk)
+        for match in pattern.findall(chunk, 0, end):
+            # Puede haber varias claves separadas por coma en una sola cita
+            for key in match.split(','):
+                citations.add(key.strip())
+        pending = open_match.group(0) if open_match and len(chunk) - end <= _MAX_OPEN_CITE else ''
+    return citations
+
 def extract_citations(tex_content):
     """
     Extrae todas las claves de citas utilizadas en los archivos .tex.
@@ -45,17 +186,51 @@ def extract_citations(tex_content):
     Returns:
         set: Conjunto de claves citadas encontradas en el texto.
     """
-    pattern = re.compile(r'\\cite\w*\{([^}]+)\}')  # Busca \cite{...}, \citep{...}, etc.
-    citations = set()
-    for match in pattern.findall(tex_content):
-        # Puede haber varias claves separadas por coma en una sola cita
-        for key in match.split(','):
-            citations.add(key.strip())
-    return citations
+    # El texto completo se procesa como un único fragmento, sin dividirlo en líneas
+    return update_citations(set(), (tex_content,))
+
+def iter_bib_entries(bib_data):
+    """
+    Recorre las entradas de un archivo .bib, devolviéndolas una a una.
+    Trabaja directamente sobre los bytes del archivo: no lo divide en líneas ni
+    decodifica el cuerpo de las entradas, que se devuelven como vistas sin copia.
+    Solo se decodifica la clave de cada entrada. Las entradas cuya cabecera no tiene una
+    clave reconocible (p. ej. @string{...} o @preamble{...}) se devuelven con clave None.
+    Los saltos de línea \r\n o \r se normalizan a '\n', como al leer el archivo en modo texto.
+    
+    Args:
+        bib_data (bytes): Contenido binario completo del archivo .bib.
+    
+    Yields:
+        tuple: Pares (clave o None, memoryview con el texto completo de la entrada).
+    
+    Raises:
+        UnicodeDecodeError: Si alguna clave no está codificada en UTF-8.
+    """
+    # Normalizamos los saltos de línea para no mezclarlos con los separadores de las
+    # salidas. Solo se copia el contenido si hay algún '\r'
+    if _CR_NEWLINE_RE.search(bib_data):
+        bib_data = _CR_NEWLINE_RE.sub(b'\n', bib_data)
+    view = memoryview(bib_data)
+    # Posiciones donde comienza cada entrada (líneas cuyo primer carácter no blanco es '@'),
+    # con el final del contenido como centinela para delimitar la última
+    starts = [0] if _FIRST_ENTRY_RE.match(bib_data) else []
+    starts.extend(m.start() + 1 for m in _ENTRY_START_RE.finditer(bib_data))
+    starts.append(len(bib_data))
+
+    for begin, end in zip(starts, starts[1:]):
+        # Excluimos el salto de línea que separa esta entrada de la siguiente
+        if bib_data[end - 1] == 0x0A:
+            end -= 1
+        # Extraemos la clave de la entrada, por ejemplo: @article{clave,
+        key_match = _ENTRY_HEAD_RE.match(bib_data, begin, end)
+        key = key_match.group(1).decode('utf-8') if key_match else None
+        yield key, view[begin:end]
 
 def extract_bib_entries(bib_content):
     """
     Extrae todas las entradas de un archivo .bib y las organiza en un diccionario.
+    Las entradas sin clave reconocible no se incluyen.
     
     Args:
         bib_content (str): Contenido completo del archivo .bib.
@@ -63,29 +238,61 @@ def extract_bib_entries(bib_content):
     Returns:
         dict: Diccionario con claves de entrada como llaves y la entrada completa como valor.
     """
-    entries = {}
-    current_key = None
-    current_entry = []
-    inside_entry = False
-
-    for line in bib_content.splitlines():
-        if line.strip().startswith('@'):
-            # Si ya estábamos procesando una entrada, la guardamos
-            if current_key:
-                entries[current_key] = '\n'.join(current_entry)
-            current_entry = [line]
-            inside_entry = True
-            # Extraemos la clave de la entrada, por ejemplo: @article{clave,
-            key_match = re.match(r'@\w+\{([^,]+),', line)
-            current_key = key_match.group(1).strip() if key_match else None
-        elif inside_entry:
-            current_entry.append(line)
-
-    # Guardamos la última entrada si existe
-    if current_key:
-        entries[current_key] = '\n'.join(current_entry)
-
-    return entries
+    return {
+        key: str(entry, 'utf-8')
+        for key, entry in iter_bib_entries(bib_content.encode('utf-8'))
+        if key is not None
+    }
+
+def scan_tex_file(z, tex_file, mapped=None):
+    """
+    Extrae las claves citadas en un archivo .tex contenido en el ZIP.
+    Los archivos normales se leen de una vez y los muy grandes se recorren
+    por bloques sin cargarlos completos en memoria.
+    
+    Args:
+        z (zipfile.ZipFile): Archivo ZIP abierto.
+        tex_file (zipfile.ZipInfo): Entrada del .tex dentro del ZIP.
+        mapped (mmap.mmap, opcional): El mismo ZIP proyectado en memoria (ver read_member).
+    
+    Returns:
+        set: Conjunto de claves citadas en el archivo.
+    
+    Raises:
+        UnicodeDecodeError: Si el archivo no está codificado en UTF-8.
+    """
+    citations = set()
+    if tex_file.file_size > _STREAM_THRESHOLD:
+        with BufferedReader(z.open(tex_file), buffer_size=_IO_BUFFER_SIZE) as f:
+            update_citations(citations, iter_text_blocks(TextIOWrapper(f, encoding='utf-8')))
+    else:
+        update_citations(citations, (decode_text(read_member(z, tex_file, mapped)),))
+    return citations
+
+def write_entries(path, entries):
+    """
+    Escribe en un archivo .bib las entradas recibidas, separadas por una línea en blanco.
+    Los datos se sincronizan con el disco antes de terminar, de modo que el llamador
+    puede escribir en un archivo temporal y sustituir con él al definitivo (os.replace).
+    Si se produce cualquier error, elimina el archivo a medio escribir y relanza el error.
+    
+    Args:
+        path (str | Path): Ruta del archivo a generar.
+        entries (list): Textos (bytes o memoryview) de las entradas a escribir.
+    """
+    path = Path(path)
+    try:
+        with path.open('wb', buffering=_IO_BUFFER_SIZE) as f:
+            for i, entry in enumerate(entries):
+                if i:
+                    f.write(b'\n\n')
+                f.write(entry)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        with suppress(OSError):
+            path.unlink(missing_ok=True)
+        raise
 
 def process_zip(zip_path, output_bib_path):
     """
@@ -99,9 +306,14 @@ def process_zip(zip_path, output_bib_path):
     try:
         console.rule("[bold blue]Inicio del proceso de limpieza de bibliografía")
         with zipfile.ZipFile(zip_path, 'r') as z:
-            # Listamos los archivos .tex y .bib dentro del zip
-            tex_files = [f for f in z.namelist() if f.endswith('.tex')]
-            bib_files = [f for f in z.namelist() if f.endswith('.bib')]
+            # Clasificamos los archivos .tex y .bib del zip en una sola pasada. Guardamos los
+            # ZipInfo para abrirlos después sin volver a buscarlos en el directorio central
+            tex_files, bib_files = [], []
+            for info in z.infolist():
+                if info.filename.endswith('.tex'):
+                    tex_files.append(info)
+                elif info.filename.endswith('.bib'):
+                    bib_files.append(info)
 
             console.log(f"[bold cyan]Archivos .tex encontrados:[/] {len(tex_files)}")
             console.log(f"[bold cyan]Archivos .bib encontrados:[/] {len(bib_files)}")
@@ -112,61 +324,140 @@ def process_zip(zip_path, output_bib_path):
                 raise ValueError("No se encontró ningún archivo .tex en el ZIP.")
 
             bib_file = bib_files[0]  # Solo se toma el primer .bib encontrado
-            all_tex = ''
-            # Leemos y concatenamos el contenido de todos los .tex
-            for tex_file in track(tex_files, description="[green]Leyendo archivos .tex..."):
+
+            # Si algún archivo a leer está almacenado sin comprimir, proyectamos el ZIP en
+            # memoria para leerlo sin copias. Si no se puede proyectar, se lee con zipfile.
+            # No se cierra explícitamente: se libera al destruirse, cuando ya no quedan
+            # vistas sobre su contenido
+            mapped = None
+            if any(info.compress_type == zipfile.ZIP_STORED for info in (bib_file, *tex_files)):
                 try:
-                    with z.open(tex_file) as f:
-                        all_tex += TextIOWrapper(f, encoding='utf-8').read()
-                except UnicodeDecodeError:
-                    console.log(f"[bold red]Error:[/] El archivo {tex_file} no está codificado en UTF-8.")
-                    return
-
-            console.log("[bold green]Extrayendo claves citadas de los archivos .tex...")
-            cited_keys = extract_citations(all_tex)
-            console.log(f"[bold green]Total de claves citadas encontradas:[/] {len(cited_keys)}")
+                    with open(zip_path, 'rb') as raw:
+                        mapped = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    mapped = None
 
-            # Leemos el contenido del .bib
+            # Leemos primero el .bib, sin decodificarlo, para conocer todas sus claves y poder
+            # dejar de leer .tex en cuanto estén todas citadas. Las entradas son vistas sobre
+            # el contenido leído, por lo que guardarlas no copia su texto. Igual que en
+            # extract_bib_entries, si una clave se repite prevalece su última definición.
+            # Las entradas sin clave reconocible no pueden citarse: irán al respaldo
+            console.log("[bold green]Extrayendo entradas del archivo .bib...")
+            bib_data = read_member(z, bib_file, mapped)
+            bib_entries = {}
+            unkeyed_entries = []
             try:
-                with z.open(bib_file) as f:
-                    bib_content = TextIOWrapper(f, encoding='utf-8').read()
+                for key, entry in iter_bib_entries(bib_data):
+                    if key is None:
+                        unkeyed_entries.append(entry)
+                    else:
+                        bib_entries[key] = entry
             except UnicodeDecodeError:
-                console.log(f"[bold red]Error:[/] El archivo {bib_file} no está codificado en UTF-8.")
+                console.log(f"[bold red]Error:[/] El archivo {bib_file.filename} no está codificado en UTF-8.")
                 return
+            # Extraemos las citas de los .tex en paralelo, ya que la descompresión de zlib
+            # libera el GIL. Todos los hilos comparten el mismo ZipFile: zipfile protege con un
+            # cerrojo cada lectura del archivo subyacente, y los miembros sin comprimir se leen
+            # directamente de la proyección en memoria
+            cited_keys = set()
+            # Claves del .bib aún sin citar: basta con descontar las citas de cada .tex,
+            # sin volver a recorrer todas las claves del .bib tras cada archivo
+            uncited_keys = set(bib_entries)
+            with ThreadPoolExecutor(max_workers=min(len(tex_files), os.cpu_count() or 1)) as pool:
+                # Los resultados llegan en el mismo orden que tex_files
+                results = pool.map(lambda tex_file: scan_tex_file(z, tex_file, mapped), tex_files)
+                for tex_file in track(tex_files, description="[green]Leyendo y extrayendo citas de los archivos .tex..."):
+                    try:
+                        tex_keys = next(results)
+                    except UnicodeDecodeError:
+                        console.log(f"[bold red]Error:[/] El archivo {tex_file.filename} no está codificado en UTF-8.")
+                        # No tiene sentido seguir leyendo el resto de .tex
+                        pool.shutdown(cancel_futures=True)
+                        return
+                    cited_keys.update(tex_keys)
+                    uncited_keys.difference_update(tex_keys)
+                    # Si ya están citadas todas las entradas del .bib, el resto de .tex no
+                    # puede cambiar el resultado: cancelamos las lecturas pendientes
+                    if not uncited_keys:
+                        console.log("[bold green]Todas las entradas del .bib están citadas; no es necesario leer más archivos .tex.")
+                        pool.shutdown(cancel_futures=True)
+                        break
 
-            console.log("[bold green]Extrayendo entradas del archivo .bib...")
-            all_entries = extract_bib_entries(bib_content)
-            console.log(f"[bold green]Total de entradas en el .bib original:[/] {len(all_entries)}")
-
-            # Filtramos las entradas citadas y las no citadas
-            used_entries = {k: v for k, v in all_entries.items() if k in cited_keys}
-            removed_entries = {k: v for k, v in all_entries.items() if k not in cited_keys}
+            console.log(f"[bold green]Total de claves citadas encontradas:[/] {len(cited_keys)}")
 
-            # Guardamos el nuevo .bib solo con las entradas citadas
+            # Clasificamos las entradas del .bib y las escribimos en el .bib limpio y en el
+            # respaldo. Las listas guardan vistas sobre el contenido leído, sin copiar su texto
+            console.log("[bold green]Clasificando entradas del archivo .bib...")
+            output_path = Path(output_bib_path)
+            bak_path = output_path.with_name('remove.bib.bak')
+            # Las salidas se escriben primero en archivos temporales, que solo sustituyen a
+            # los definitivos cuando ambas se han escrito por completo: si falla la escritura,
+            # los archivos existentes quedan intactos. Después se sustituye primero el .bib
+            # limpio y luego el respaldo
+            output_tmp = output_path.with_name(output_path.name + '.tmp')
+            bak_tmp = bak_path.with_name(bak_path.name + '.tmp')
+            used_entries = []
+            removed_entries = list(unkeyed_entries)
             try:
-                with open(output_bib_path, 'w', encoding='utf-8') as f:
-                    f.write('\n\n'.join(used_entries.values()))
-                console.log(f"[bold blue]Archivo limpio generado:[/] {output_bib_path}")
-            except (IOError, OSError) as e:
-                console.log(f"[bold red]Error al escribir el archivo de salida {output_bib_path}:[/] {e}")
+                for key, entry in bib_entries.items():
+                    # Las entradas conservadas se validan como UTF-8 antes de escribirlas
+                    if key in cited_keys:
+                        str(entry, 'utf-8')
+                        used_entries.append(entry)
+                    else:
+                        removed_entries.append(entry)
+            except UnicodeDecodeError:
+                console.log(f"[bold red]Error:[/] El archivo {bib_file.filename} no está codificado en UTF-8.")
                 return
-
-            # Guardamos las entradas eliminadas en un archivo de respaldo
-            bak_path = os.path.join(os.path.dirname(output_bib_path), 'remove.bib.bak')
+            # Guardamos en cada paso qué archivo se está escribiendo para indicar cuál falló
+            failed_path = output_path
+            output_replaced = False
             try:
-                with open(bak_path, 'w', encoding='utf-8') as f:
-                    f.write('\n\n'.join(removed_entries.values()))
-                console.log(f"[bold yellow]Entradas removidas guardadas en:[/] {bak_path}")
+                write_entries(output_tmp, used_entries)
+                # El respaldo solo se crea si hay alguna entrada eliminada
+                failed_path = bak_path
+                if removed_entries:
+                    write_entries(bak_tmp, removed_entries)
+                failed_path = output_path
+                os.replace(output_tmp, output_path)
+                output_replaced = True
+                # Sin entradas eliminadas no hay respaldo: borramos el que pudiera quedar de
+                # una ejecución anterior, que ya no se correspondería con este resultado
+                failed_path = bak_path
+                if removed_entries:
+                    os.replace(bak_tmp, bak_path)
+                else:
+                    bak_path.unlink(missing_ok=True)
             except (IOError, OSError) as e:
-                console.log(f"[bold red]Error al escribir el archivo de respaldo {bak_path}:[/] {e}")
+                if failed_path == output_path:
+                    console.log(f"[bold red]Error al escribir el archivo de salida {output_bib_path}:[/] {e}")
+                else:
+                    console.log(f"[bold red]Error al escribir el archivo de respaldo {bak_path}:[/] {e}")
+                    if output_replaced:
+                        console.log(f"[bold yellow]El archivo limpio {output_bib_path} sí se generó, pero el respaldo no corresponde a este resultado.")
                 return
+            finally:
+                # Descartamos los temporales que hayan quedado tras un error
+                for tmp_path in (output_tmp, bak_tmp):
+                    with suppress(OSError):
+                        tmp_path.unlink(missing_ok=True)
+
+            total_count = len(bib_entries) + len(unkeyed_entries)
+            used_count = len(used_entries)
+            removed_count = len(removed_entries)
+            console.log(f"[bold green]Total de entradas en el .bib original:[/] {total_count}")
+            console.log(f"[bold blue]Archivo limpio generado:[/] {output_bib_path}")
+            if removed_count:
+                console.log(f"[bold yellow]Entradas removidas guardadas en:[/] {bak_path}")
+            else:
+                console.log("[bold yellow]No hay entradas removidas; no se genera el archivo de respaldo.")
 
             # Mostramos un resumen del proceso
             resumen = (
                 f"[bold green]Resumen de limpieza:[/]\n"
-                f"  [bold]Total de entradas en .bib original:[/] {len(all_entries)}\n"
-                f"  [bold]Entradas citadas en los .tex:[/] {len(used_entries)}\n"
-                f"  [bold]Entradas eliminadas:[/] {len(removed_entries)}\n"
+                f"  [bold]Total de entradas en .bib original:[/] {total_count}\n"
+                f"  [bold]Entradas citadas en los .tex:[/] {used_count}\n"
+                f"  [bold]Entradas eliminadas:[/] {removed_count}\n"
             )
             console.print(Panel(resumen, title="[bold blue]Proceso completado", expand=False))
             console.rule("[bold blue]Fin del proceso")